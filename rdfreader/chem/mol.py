@@ -1,16 +1,55 @@
-from typing import Any
+import sys
+from typing import Any, Optional
 
 from rdkit.Chem import Mol, MolFromMolBlock, MolFromSmiles, MolToMolBlock, MolToSmiles
 
 from rdfreader.exceptions import InvalidMoleculeError
 from rdfreader.parse.molblock import get_mol_block_metadata
 
+# component types of a molecule within a reaction. Interned so every molecule
+# of a type shares the same string object.
+REACTANT: str = sys.intern("reactant")
+PRODUCT: str = sys.intern("product")
+CATALYST: str = sys.intern("catalyst")
+SOLVENT: str = sys.intern("solvent")
+OTHER_REAGENT: str = sys.intern("other_reagent")
+
+
+class _Unset:
+    """Type of the _UNSET sentinel, which marks a cached value as not yet
+    computed (None is a valid result for a molecule RDKit cannot parse).
+
+    Pickles by reference so the sentinel keeps its identity when molecules
+    are copied or sent to other processes.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_UNSET"
+
+    def __repr__(self) -> str:
+        return "_UNSET"
+
+
+_UNSET = _Unset()
+
 
 class Molecule:
+    __slots__ = (
+        "_mol_block",
+        "_rd_mol",
+        "_smiles",
+        "_metadata",
+        "properties",
+        "except_on_invalid_molecule",
+        "component_type",
+    )
+
     def __init__(
         self,
         mol_block: str = None,
-        properties: dict[str, Any] = dict(),
+        properties: Optional[dict[str, Any]] = None,
         except_on_invalid_molecule: bool = True,
         component_type: str = None,
     ):
@@ -25,12 +64,22 @@ class Molecule:
             A mol block string.
         properties : dict[str, Any]
             A dictionary of properties.
+        except_on_invalid_molecule : bool
+            If True, raise an InvalidMoleculeError if RDKit cannot read and
+            sanitize the mol block. Otherwise the mol block is not parsed
+            until rd_mol (or smiles) is used, and an invalid mol block gives
+            an rd_mol and smiles of None.
+        component_type : str
+            The role of the molecule in a reaction, e.g. "reactant".
         """
 
         self.except_on_invalid_molecule: bool = except_on_invalid_molecule
-        self.properties: dict[str, Any] = properties
+        self.properties: dict[str, Any] = {} if properties is None else properties
+        self._rd_mol: Mol = _UNSET
+        self._smiles: str = _UNSET
+        self._metadata: dict[str, Any] = _UNSET
         self.mol_block: str = mol_block  # calls mol_block setter
-        self.component_type: str = component_type
+        self.component_type: str = sys.intern(component_type) if component_type is not None else None
 
     @property
     def mol_block(self) -> str:
@@ -54,15 +103,27 @@ class Molecule:
         """
         if not mol_block:
             self._mol_block = None
+            self._clear_cache()
         else:
             self._from_mol_block(mol_block)
 
+    def _clear_cache(self) -> None:
+        """Discard values derived from the mol block."""
+        self._rd_mol = _UNSET
+        self._smiles = _UNSET
+        self._metadata = _UNSET
+
     @property
     def rd_mol(self) -> Mol:
-        """Return the RDKit molecule object."""
-        return MolFromMolBlock(
-            self.mol_block,
-        )
+        """Return the RDKit molecule object.
+
+        The mol block is parsed on first access and the result is cached.
+        """
+        if self._rd_mol is _UNSET:
+            self._rd_mol = MolFromMolBlock(
+                self.mol_block,
+            )
+        return self._rd_mol
 
     @property
     def smiles(self) -> str:
@@ -71,21 +132,27 @@ class Molecule:
         Returns:
             str: SMILES string of the molecule.
         """
-        try:
-            return MolToSmiles(self.rd_mol)
-        except Exception:
-            return None
+        if self._smiles is _UNSET:
+            try:
+                self._smiles = MolToSmiles(self.rd_mol)
+            except Exception:
+                self._smiles = None
+        return self._smiles
 
     @property
     def metadata(self) -> dict[str, Any]:
         """Returns the metadata of the molecule from the mol block string.
 
+        The metadata is parsed on first access and cached.
+
         Returns:
             dict[str, Any]: The metadata of the molecule.
         """
-        return get_mol_block_metadata(self.mol_block)
+        if self._metadata is _UNSET:
+            self._metadata = get_mol_block_metadata(self.mol_block)
+        return self._metadata
 
-    def _from_mol_block(self, mol_block: str, properties: dict[str, Any] = dict()) -> None:
+    def _from_mol_block(self, mol_block: str, properties: Optional[dict[str, Any]] = None) -> None:
         """Initialize the molecule object with a mol block string.
 
         Parameters
@@ -93,17 +160,37 @@ class Molecule:
         mol_block : str
             A mol block string.
         """
-        self.properties.update(properties)
+        if properties:
+            self.properties.update(properties)
         self._mol_block = mol_block
+        self._clear_cache()
 
         if self.except_on_invalid_molecule:
-            try:
-                assert self.rd_mol is not None
-            except AssertionError:
+            # the sanitized molecule is kept for rd_mol, so the mol block is
+            # only parsed once
+            self._rd_mol = MolFromMolBlock(mol_block)
+            if self._rd_mol is None:
                 raise InvalidMoleculeError("mol_block is not a valid mol block string.")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the molecule for pickling.
+
+        The RDKit molecule and SMILES are left out and rebuilt from the mol
+        block when used, as pickled RDKit molecules lose their properties
+        (e.g. _Name).
+        """
+        state = {slot: getattr(self, slot) for slot in Molecule.__slots__}
+        state["_rd_mol"] = _UNSET
+        state["_smiles"] = _UNSET
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled molecule."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     @classmethod
-    def from_mol_block(cls, mol_block: str, properties: dict[str, Any] = {}) -> "Molecule":
+    def from_mol_block(cls, mol_block: str, properties: Optional[dict[str, Any]] = None) -> "Molecule":
         """Create a Molecule object from a mol block string.
 
         Parameters
@@ -124,11 +211,42 @@ class Molecule:
     def __eq__(self, __o: object) -> bool:
         """Returns True if the molecules are equal.
 
+        Molecules are compared by their canonical SMILES, so different mol
+        blocks of the same molecule are equal. If either molecule has no
+        SMILES (RDKit could not parse it), the mol blocks are compared.
+
         Returns
         -------
         bool
             True if the molecules are equal.
         """
+        if not isinstance(__o, Molecule):
+            return False
+        if self.smiles is None or __o.smiles is None:
+            return self.mol_block == __o.mol_block
+        return self.smiles == __o.smiles
+
+    def __hash__(self) -> int:
+        """Returns a hash of the molecule, consistent with __eq__.
+
+        Returns
+        -------
+        int
+            The hash of the canonical SMILES, or of the mol block if there is
+            no SMILES.
+        """
+        if self.smiles is None:
+            return hash(self.mol_block)
+        return hash(self.smiles)
+
+    def eq_raw(self, __o: object) -> bool:
+        """Returns True if the molecules have identical mol block strings.
+
+        Returns
+        -------
+        bool
+            True if the mol blocks are equal.
+        """
         if not isinstance(__o, Molecule):
             return False
         return self.mol_block == __o.mol_block
@@ -167,20 +285,28 @@ class Molecule:
 
 
 class Reactant(Molecule):
-    def __init__(*args, **kwargs):
-        super().__init__(**args, **kwargs, component_type="reactant")
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, component_type=REACTANT, **kwargs)
 
 
 class Product(Molecule):
-    def __init__(*args, **kwargs):
-        super().__init__(**args, **kwargs, component_type="product")
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, component_type=PRODUCT, **kwargs)
 
 
 class Solvent(Molecule):
-    def __init__(*args, **kwargs):
-        super().__init__(**args, **kwargs, component_type="solvent")
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, component_type=SOLVENT, **kwargs)
 
 
 class Catalyst(Molecule):
-    def __init__(*args, **kwargs):
-        super().__init__(**args, **kwargs, component_type="catalyst")
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, component_type=CATALYST, **kwargs)
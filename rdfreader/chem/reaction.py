@@ -1,18 +1,49 @@
+import functools
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from rdkit.Chem.rdChemReactions import ChemicalReaction, ReactionFromSmarts
 
-from rdfreader.chem.mol import Molecule
+from rdfreader.chem.mol import _UNSET, CATALYST, OTHER_REAGENT, PRODUCT, REACTANT, SOLVENT, Molecule
 from rdfreader.chem.utils import reaction_smiles
 from rdfreader.exceptions import InvalidReactionError
+from rdfreader.parallel import process_map
 from rdfreader.parse.rxnblock import DatumParser, get_rxn_block_metadata, mol_blocks_from_rxn_block, validate_rxn_block
 from rdfreader.parse.utils import CTF_RXNBLOCK_HEADER_FORMAT_STRING
 
 logger = logging.getLogger(__name__)
 
 
+def _reaction_from_smiles(smiles: str) -> ChemicalReaction:
+    """Parse a reaction SMILES string into an RDKit reaction."""
+    return ReactionFromSmarts(smiles, useSmiles=True)
+
+
+# _reaction_from_smiles with its results cached, so RDKit reactions can be
+# shared between identical reactions. None when the cache is disabled, see
+# Reaction.set_rd_rxn_cache_size.
+_cached_reaction_from_smiles: Optional[Callable[[str], ChemicalReaction]] = None
+
+
 class Reaction:
+    __slots__ = (
+        "rxn_block",
+        "rdf_metadata",
+        "id",
+        "lineno",
+        "rdf_file",
+        "products",
+        "reactants",
+        "catalysts",
+        "solvents",
+        "other_reagents",
+        "properties",
+        "metadata",
+        "_smiles",
+        "_smiles_no_reagents",
+        "_rd_rxn",
+    )
+
     def __init__(
         self,
         rxn_block: str = None,
@@ -45,6 +76,10 @@ class Reaction:
         self.properties: dict[str, str] = dict()
         self.metadata: dict[str, Any] = dict()
 
+        self._smiles: str = _UNSET
+        self._smiles_no_reagents: str = _UNSET
+        self._rd_rxn: ChemicalReaction = _UNSET
+
         if self.rxn_block is not None:
             self._from_rxn_block(
                 header_format_string=header_format_string,
@@ -54,6 +89,38 @@ class Reaction:
     def __str__(self) -> str:
         return f"Reaction({self.id}, {self.smiles})"
 
+    @classmethod
+    def from_rxn_blocks_parallel(
+        cls,
+        rxn_blocks: Iterable[str],
+        processes: Optional[int] = None,
+        chunksize: int = 64,
+        **kwargs,
+    ) -> Iterator["Reaction"]:
+        """Create reactions from many rxn blocks using a pool of processes.
+
+        Reactions are yielded in the same order as the rxn blocks. The rxn
+        blocks are read as reactions are yielded, rather than all at once.
+
+        Parameters
+        ----------
+        rxn_blocks : Iterable[str]
+            The reaction block strings.
+        processes : int, optional
+            The number of worker processes. Defaults to the number of CPUs.
+        chunksize : int, optional
+            The number of rxn blocks sent to a worker at a time.
+        **kwargs
+            Passed to Reaction for each rxn block, e.g.
+            except_on_invalid_molecule.
+
+        Returns
+        -------
+        Iterator[Reaction]
+            The reactions.
+        """
+        return process_map(functools.partial(cls, **kwargs), rxn_blocks, processes=processes, chunksize=chunksize)
+
     def _from_rxn_block(
         self,
         header_format_string: str = CTF_RXNBLOCK_HEADER_FORMAT_STRING,
@@ -71,7 +138,7 @@ class Reaction:
             raise ValueError("Reaction block is invalid.")
 
         # get the headers from the rxn block.
-        self.metadata.update(get_rxn_block_metadata(self.rxn_block, header_format_string=header_format_string))
+        self.metadata = get_rxn_block_metadata(self.rxn_block, header_format_string=header_format_string)
 
         # get the reactants and product mol_blocks, create a molecule object
         # for each, and add it to the reaction.
@@ -80,21 +147,14 @@ class Reaction:
             self.metadata["reactant_count"],
             self.metadata["product_count"],
         )
-        for mol_block in reactant_mol_blocks:
-            self.reactants.append(
-                Molecule(
-                    mol_block,
-                    except_on_invalid_molecule=except_on_invalid_molecule,
-                )
-            )
-
-        for mol_block in product_mol_blocks:
-            self.products.append(
-                Molecule(
-                    mol_block,
-                    except_on_invalid_molecule=except_on_invalid_molecule,
-                )
-            )
+        self.reactants = [
+            Molecule(mol_block, except_on_invalid_molecule=except_on_invalid_molecule)
+            for mol_block in reactant_mol_blocks
+        ]
+        self.products = [
+            Molecule(mol_block, except_on_invalid_molecule=except_on_invalid_molecule)
+            for mol_block in product_mol_blocks
+        ]
 
         # use functions in rdfreader/parse/rdf.py to pull out dtype/datum
         # pairs from the rxn block
@@ -102,37 +162,97 @@ class Reaction:
             self.rxn_block,
         )
 
+        # molecule list for each component type
+        component_lists: dict[str, list[Molecule]] = {
+            REACTANT: self.reactants,
+            PRODUCT: self.products,
+            CATALYST: self.catalysts,
+            SOLVENT: self.solvents,
+            OTHER_REAGENT: self.other_reagents,
+        }
+
         for dtype, datum in datum_parser:
             if not isinstance(datum, Molecule):
                 self.properties[dtype] = datum
             else:
                 # add to the appropriate molecule list
-                getattr(self, f"{datum.component_type}s").append(datum)
+                component_lists[datum.component_type].append(datum)
 
-        if self.rd_rxn is None:
+        # when invalid molecules raise, every component has already been
+        # parsed and sanitized by RDKit, so building the RDKit reaction is
+        # deferred until it is requested.
+        if not except_on_invalid_molecule and self.rd_rxn is None:
             raise ValueError("Invalid reaction: couldn't parse in rdkit.")
 
     @property
     def smiles(self) -> str:
-        return reaction_smiles(
-            self.reactants,
-            self.products,
-            self.reagents,
-        )
+        """Return the reaction SMILES string.
+
+        The SMILES string is built on first access and cached, so component
+        lists should not be modified after it has been read.
+        """
+        if self._smiles is _UNSET:
+            self._smiles = reaction_smiles(
+                self.reactants,
+                self.products,
+                self.reagents,
+            )
+        return self._smiles
 
     @property
     def smiles_no_reagents(self) -> str:
-        return reaction_smiles(
-            self.reactants,
-            self.products,
-        )
+        """Return the reaction SMILES string without reagents, cached as for
+        smiles."""
+        if self._smiles_no_reagents is _UNSET:
+            self._smiles_no_reagents = reaction_smiles(
+                self.reactants,
+                self.products,
+            )
+        return self._smiles_no_reagents
 
     @property
     def rd_rxn(self) -> ChemicalReaction:
-        try:
-            return ReactionFromSmarts(self.smiles, useSmiles=True)
-        except ValueError as e:
-            raise InvalidReactionError(f"Invalid reaction: {e}") from e
+        """Return the RDKit reaction object, built once from the reaction
+        SMILES.
+
+        If enabled with set_rd_rxn_cache_size, parsed reactions are cached
+        across Reaction objects by SMILES, and each reaction gets its own copy.
+        """
+        if self._rd_rxn is _UNSET:
+            try:
+                if _cached_reaction_from_smiles is None:
+                    self._rd_rxn = _reaction_from_smiles(self.smiles)
+                else:
+                    rd_rxn = _cached_reaction_from_smiles(self.smiles)
+                    self._rd_rxn = ChemicalReaction(rd_rxn) if rd_rxn is not None else None
+            except ValueError as e:
+                raise InvalidReactionError(f"Invalid reaction: {e}") from e
+        return self._rd_rxn
+
+    @staticmethod
+    def set_rd_rxn_cache_size(maxsize: int) -> None:
+        """Set the number of RDKit reactions cached across Reaction objects.
+
+        The cache is disabled by default. It helps when the same reaction
+        appears many times, e.g. in a rdf file with repeated records, but
+        slows down rd_rxn for unique reactions, as each cached reaction is
+        copied. The cache is per process.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of cached reactions, 0 disables the cache.
+            Changing the size empties the cache.
+        """
+        global _cached_reaction_from_smiles
+        _cached_reaction_from_smiles = functools.lru_cache(maxsize=maxsize)(_reaction_from_smiles) if maxsize else None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of RDKit reactions shared between Reaction
+        objects."""
+        if _cached_reaction_from_smiles is not None:
+            _cached_reaction_from_smiles.cache_clear()
 
     @property
     def reagents(self) -> list[Molecule]:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from rdfreader.chem.mol import Molecule
 
 
@@ -15,19 +17,18 @@ def mol_list_to_smiles(mol_list: list[Molecule]) -> str:
         The SMILES string.
     """
 
-    return ".".join([mol.smiles for mol in mol_list if mol.smiles is not None])
+    return ".".join([smiles for smiles in (mol.smiles for mol in mol_list) if smiles is not None])
 
 
 def reaction_smiles(
     reactants: list[Molecule],
     products: list[Molecule],
-    reagents: list[Molecule] = [],
+    reagents: Optional[list[Molecule]] = None,
 ) -> str:
     """Create a reaction smiles string from lists of product, reactant, and
-    reagent molecules."""
+    reagent molecules.
 
-    product_smiles = mol_list_to_smiles(products)
-    reactant_smiles = mol_list_to_smiles(reactants)
-    reagent_smiles = mol_list_to_smiles(reagents)
+    Each molecule's SMILES is read once, in reactant, reagent, product order.
+    """
 
-    return ">".join([reactant_smiles, reagent_smiles, product_smiles])
+    return ">".join(mol_list_to_smiles(mol_list) for mol_list in (reactants, reagents or (), products))
@@ -0,0 +1,61 @@
+import collections
+import itertools
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+def _map_chunk(function: Callable[..., Any], chunk: list[tuple[Any, ...]]) -> list[Any]:
+    """Call a function with each set of arguments in a chunk, in a worker
+    process."""
+    return [function(*args) for args in chunk]
+
+
+def process_map(
+    function: Callable[..., Any],
+    *iterables: Iterable[Any],
+    processes: Optional[int] = None,
+    chunksize: int = 1,
+) -> Iterator[Any]:
+    """Map a function over iterables using a pool of processes.
+
+    Results are yielded in order. Processes are used rather than threads as
+    parsing holds the GIL. The iterables are read lazily: at most two chunks
+    per process are waiting or running at a time, so memory stays bounded
+    however many items there are.
+
+    Parameters
+    ----------
+    function : Callable
+        The function to call, which must be picklable.
+    *iterables : Iterable
+        The arguments to call the function with, as for map.
+    processes : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+    chunksize : int, optional
+        The number of items sent to a worker at a time.
+
+    Returns
+    -------
+    Iterator[Any]
+        The results of each call.
+    """
+    processes = processes or os.cpu_count() or 1
+    max_pending = 2 * processes
+    arguments = zip(*iterables)
+    chunks = iter(lambda: list(itertools.islice(arguments, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: collections.deque[Future] = collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_map_chunk, function, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # don't run chunks whose results won't be used, e.g. if the
+            # caller stops iterating early
+            for future in pending:
+                future.cancel()
@@ -4,6 +4,7 @@ from typing import Any, Callable
 from rdfreader.parse.utils import (
     CTF_DEFAULT_LETTER_TO_FIELD_MAPPING,
     CTF_DEFAULT_MOLBLOCK_HEADER_FORMAT_STRING,
+    _first_n_lines,
     _parse_block_header_line,
     get_line_item,
     get_whole_line_item,
@@ -45,11 +46,11 @@ def get_mol_block_metadata(
     """
 
     metadata = {}
-    mol_block_lines = mol_block.split("\n")
+    mol_block_lines = _first_n_lines(mol_block, 3)
     metadata["molecule_name"] = get_whole_line_item(mol_block_lines[0])
     metadata.update(_parse_block_header_line(mol_block_lines[1], header_format_string, header_field_mapping))
     metadata["comment"] = get_whole_line_item(mol_block_lines[2])
-    large_regno: str = _parse_large_regno(mol_block_lines)
+    large_regno: str = _parse_large_regno(mol_block)
     if large_regno is not None:
         # overwrite the registry number from the header with the large
         # registry number if it is present
@@ -58,14 +59,17 @@ def get_mol_block_metadata(
     return metadata
 
 
-def _parse_large_regno(mol_block_lines: list[str]) -> str:
+def _parse_large_regno(mol_block: str) -> str:
     """Searches the molblock a line beginning with M REG and returns the value
     of it if present.
 
+    The M REG line is in the properties block, after the atoms and bonds, so
+    the molblock is searched from the end.
+
     Parameters
     ----------
-    mol_block_lines : list[str]
-        A molblock string that has been split into a list of lines.
+    mol_block : str
+        A molblock string.
 
     Returns
     -------
@@ -74,8 +78,11 @@ def _parse_large_regno(mol_block_lines: list[str]) -> str:
         present.
     """
 
-    for line in mol_block_lines:
-        if line.startswith("M  REG "):
-            return get_line_item(line, [7, len(line)])
+    line_start = "\nM  REG "
+    idx = mol_block.rfind(line_start)
+    if idx == -1:
+        return None
 
-    return None
+    start = idx + len(line_start)
+    end = mol_block.find("\n", start)
+    return get_line_item(mol_block, (start, end if end != -1 else None))
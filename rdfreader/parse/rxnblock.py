@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any, Callable, Iterator
 
-from rdfreader.chem.mol import Molecule
+from rdfreader.chem.mol import CATALYST, OTHER_REAGENT, SOLVENT, Molecule
 from rdfreader.parse.utils import (
     CTF_COMPONENT_COUNT_FORMAT_STRING,
     CTF_DEFAULT_LETTER_TO_FIELD_MAPPING,
     CTF_RXNBLOCK_HEADER_FORMAT_STRING,
+    _first_n_lines,
     _parse_block_header_line,
     get_whole_line_item,
     make_string_python_safe,
@@ -37,7 +37,7 @@ def get_rxn_block_metadata(
     """
 
     metadata = {}
-    rxn_block_lines: list[str] = rxn_block.split("\n")
+    rxn_block_lines: list[str] = _first_n_lines(rxn_block, 5)
     metadata["reaction_name"] = get_whole_line_item(rxn_block_lines[1])
     metadata.update(_parse_block_header_line(rxn_block_lines[2], header_format_string, header_field_mapping))
     metadata["comment"] = get_whole_line_item(rxn_block_lines[3])
@@ -76,26 +76,27 @@ class DatumParser:
 
         dtype_string_identifier = "$DTYPE "
 
-        lines = self.rxn_block.split("\n")
+        dtype_string = None
+        datum_parts: list[str] = []
 
-        for line_idx, line in enumerate(lines):
+        # capture the lines following each $DTYPE line until we find a line
+        # that starts with $DTYPE again
+        for line in self.rxn_block.split("\n"):
             if line.startswith(dtype_string_identifier):
+                if dtype_string is not None:
+                    yield self.parse_datum(dtype_string, "".join(datum_parts))
                 dtype_string = line
-                datum_string = ""
-                # capture all the following lines until we find a line that
-                # starts with $DTYPE again
-                for datum_line in lines[line_idx + 1 :]:
-                    if datum_line.startswith(dtype_string_identifier):
-                        break
-
-                    if datum_line.endswith("+"):
-                        # if the line ends with a plus sign, it is a
-                        # continuation of the previous line
-                        datum_string += datum_line[:-1]
-                    else:
-                        datum_string += datum_line + "\n"
-
-                yield self.parse_datum(dtype_string, datum_string)
+                datum_parts = []
+            elif dtype_string is not None:
+                if line.endswith("+"):
+                    # if the line ends with a plus sign, it is a
+                    # continuation of the previous line
+                    datum_parts.append(line[:-1])
+                else:
+                    datum_parts.append(line + "\n")
+
+        if dtype_string is not None:
+            yield self.parse_datum(dtype_string, "".join(datum_parts))
 
     def __call__(self, *args, **kwargs):
         """Wraps parse_datum method."""
@@ -125,8 +126,8 @@ class DatumParser:
         if detect_molblock_from_datum(datum):
             datum = preprocess_datum_molblock(datum)
             # try and infer the type from the dtype string, etc.)
-            reagent_type = "other_reagent"
-            for _reagent_type in ["catalyst", "solvent"]:
+            reagent_type = OTHER_REAGENT
+            for _reagent_type in [CATALYST, SOLVENT]:
                 if _reagent_type in parsed_dtype or _reagent_type.upper() in parsed_dtype:
                     reagent_type = _reagent_type
 
@@ -166,8 +167,12 @@ def preprocess_datum_string(datum: str) -> str:
     str
         The preprocessed datum string.
     """
-    re_pattern = r"^\$DATUM\s?"
-    datum = re.sub(re_pattern, "", datum)
+    datum_prefix = "$DATUM"
+    if datum.startswith(datum_prefix):
+        datum = datum[len(datum_prefix) :]
+        if datum[:1].isspace():
+            # remove a single whitespace character following the prefix
+            datum = datum[1:]
     return datum
 
 
@@ -233,31 +238,31 @@ def mol_blocks_from_rxn_block(rxn_block: str, reactant_count: int, product_count
     products : list[str]
         The mol blocks corresponding to products.
     """
-    reactants: list[str] = []
-    products: list[str] = []
-
     start_string = "$MOL\n"
     end_string = "M  END\n"
+    max_mol_blocks = reactant_count + product_count
+
+    # mol_blocks start with "$MOL" and end with "M  END", reactants are first,
+    # then products. Find the offsets of each and slice the rxn block
+    # directly. Anything after "M  END" (e.g. reaction data following the last
+    # molblock) is not included.
+    mol_blocks: list[str] = []
+    pos = rxn_block.find(start_string)
+    while pos != -1:
+        if len(mol_blocks) == max_mol_blocks:
+            raise ValueError(
+                "The number of mol blocks in the rxn block is greater than the number of reactants and products."  # noqa: E501
+            )
 
-    # mol_blocks start with "$MOL" and end with "M  END"
-    # so we can just split on these and get the reactants and products.
-    # reactants are first, then products.
-    mol_blocks: list[str] = rxn_block.split(start_string)
-
-    # remove the first element as it is not a molblock
-    mol_blocks.pop(0)
-
-    if len(mol_blocks) > reactant_count + product_count:
-        raise ValueError(
-            "The number of mol blocks in the rxn block is greater than the number of reactants and products."  # noqa: E501
-        )
-
-    # if any element does not end with "M END", then remove all lines "M END".
-    # This is important to capture the end of the last molblock correctly and
-    # not include reaction data
-    for ii, mol_block in enumerate(mol_blocks):
-        if not mol_block.endswith(end_string):
-            mol_blocks[ii] = mol_block.split(end_string)[0] + end_string  # add the end string back on
+        start = pos + len(start_string)
+        pos = rxn_block.find(start_string, start)
+        stop = len(rxn_block) if pos == -1 else pos
+        end = rxn_block.find(end_string, start, stop)
+        if end == -1:
+            # no "M  END" line, add the end string on
+            mol_blocks.append(rxn_block[start:stop] + end_string)
+        else:
+            mol_blocks.append(rxn_block[start : end + len(end_string)])
 
     # now we have the molblocks, we can split them into reactants and products
     reactants = mol_blocks[:reactant_count]
@@ -1,6 +1,11 @@
 import datetime
+import functools
+import itertools
 import logging
+import operator
 import re
+import sys
+from string import ascii_letters, digits
 from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
@@ -10,6 +15,28 @@ CTF_DEFAULT_MOLBLOCK_HEADER_FORMAT_STRING: str = "IIPPPPPPPPMMDDYYHHmmddSSssssss
 CTF_RXNBLOCK_HEADER_FORMAT_STRING: str = "IIIIIIPPPPPPPPPMMDDYYYYHHmmRRRRRRR"
 SPRESI_RXNBLOCK_HEADER_FORMAT_STRING: str = "IIIIIIPPPPPPPPPPMMDDYYHHmmRRRRRRR"
 CTF_COMPONENT_COUNT_FORMAT_STRING: str = "rrrppp"
+
+
+class _PythonNameTranslationTable(dict):
+    """str.translate table which keeps the characters in the table and
+    replaces every other character with an underscore."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> int:
+        return ord("_")
+
+
+# translation table replacing characters not allowed in python names, and a
+# pattern matching runs of underscores, see make_string_python_safe
+_PYTHON_NAME_TRANSLATION_TABLE = _PythonNameTranslationTable(
+    {ord(character): ord(character) for character in ascii_letters + digits + "_"}
+)
+_MULTIPLE_UNDERSCORE_RE = re.compile(r"_{2,}")
+# two ints or floats separated by a dash, comma, semicolon, colon or space,
+# see parse_yield
+_YIELD_RANGE_RE = re.compile(r"^([0-9]+\.?[0-9]?)\s{0,}[-,;:]{0,}\s{0,}([0-9]+\.?[0-9]?)$")
+
 # default mapping of letter to field. This is used to map the letter in the
 # mol block header to the field in the metadata.
 # key: letter, value: tuple containing the field name, the field type and a
@@ -34,17 +61,16 @@ CTF_DEFAULT_LETTER_TO_FIELD_MAPPING: dict[str, tuple[str, Callable, Any]] = {
 }
 
 
+# default values of empty line items by type, other types default to None
+_TYPE_DEFAULTS: dict[Callable, Any] = {str: "", int: 0, float: 0.0}
+
+
 def _default_line_item(cast_type: Callable = str, default: Any = None) -> Any:
     """Return a default value for a line item."""
     if default is not None:
         return default
 
-    if cast_type in (int, float):
-        return cast_type(0)
-    if cast_type == str:
-        return ""
-    else:
-        return default
+    return _TYPE_DEFAULTS.get(cast_type)
 
 
 def get_line_item(
@@ -82,13 +108,16 @@ def get_line_item(
     """
 
     line = line[slice(*character_index)] if character_index else line
-    line = line.strip("\n")  # remove newline
-    line = line.strip()  # remove whitespace
+    line = line.strip()  # remove whitespace and newlines
 
     if not line:
         # return a default value if the line is empty
         return _default_line_item(cast_type, default)
 
+    if cast_type is str:
+        # the line is already a string, skip the cast
+        return line
+
     if cast_type:
         try:
             # attempt to cast the line to the specified type
@@ -116,7 +145,41 @@ def get_whole_line_item(line: str) -> str:
     str
         The data item.
     """
-    return get_line_item(line, (0, len(line)), str, "")
+    # equivalent to get_line_item(line, cast_type=str, default="")
+    return line.strip()
+
+
+def _first_n_lines(string: str, n: int) -> list[str]:
+    """Return the first n lines of a string, without splitting the rest of
+    it.
+
+    Lines are split on "\\n" as with str.split("\\n"); fewer than n lines are
+    returned if the string is shorter.
+
+    Parameters
+    ----------
+    string : str
+        A multiline string.
+    n : int
+        The number of lines to return.
+
+    Returns
+    -------
+    list[str]
+        The first n lines, without newline characters.
+    """
+
+    lines = []
+    pos = 0
+    for _ in range(n):
+        end = string.find("\n", pos)
+        if end == -1:
+            lines.append(string[pos:])
+            break
+        lines.append(string[pos:end])
+        pos = end + 1
+
+    return lines
 
 
 def parse_format_string(format_string) -> dict[str, tuple]:
@@ -135,23 +198,33 @@ def parse_format_string(format_string) -> dict[str, tuple]:
         A dictionary of the letter in the format string and the start and end
         character index as a tuple.
     """
+    return dict(_parse_format_string(format_string))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_format_string(format_string: str) -> tuple[tuple[str, tuple[int, int]], ...]:
+    """Cached implementation of parse_format_string.
+
+    Returns the items of the dictionary as a tuple so the cached value cannot
+    be modified by callers.
+    """
     format_string_dict = {}
 
-    last_letter = format_string[0]
-    current_letter_start_index = 0  # the index where the current letter started
-    for ii, letter in enumerate(format_string):
-        if letter != last_letter:
-            # if the letter has changed add the previous letter to the
-            # dictionary
-            format_string_dict[last_letter] = (current_letter_start_index, ii)
-            current_letter_start_index = ii
+    # each run of the same letter is one field
+    start = 0
+    for letter, run in itertools.groupby(format_string):
+        end = start + sum(1 for _ in run)
+        format_string_dict[letter] = (start, end)
+        start = end
 
-        last_letter = letter
+    return tuple(format_string_dict.items())
 
-    # add the last letter to the dictionary
-    format_string_dict[last_letter] = (current_letter_start_index, ii + 1)
 
-    return format_string_dict
+# keyword arguments of datetime.datetime that may be found in header metadata
+_DATE_TIME_KEYS: tuple[str, ...] = ("hour", "minute", "second", "day", "month", "year")
+# the date and time fields of a ctab header line, in datetime argument order
+_HEADER_DATE_TIME_KEYS: tuple[str, ...] = ("year", "month", "day", "hour", "minute")
+_get_header_date_time_args = operator.itemgetter(*_HEADER_DATE_TIME_KEYS)
 
 
 def dict_elements_to_datetime(
@@ -190,14 +263,26 @@ def dict_elements_to_datetime(
         A dictionary with the new key added.
     """
 
-    date_time_args = {k: dd[k] for k in ["hour", "minute", "second", "day", "month", "year"] if k in dd}
-
-    if not date_time_args:
-        # if no datetime keys are found, return the dictionary as is
-        return dd
+    date_time_args = None
+    if "second" not in dd:
+        try:
+            # the date and time fields of a header line, fetched in one call
+            date_time_args = _get_header_date_time_args(dd)
+            date_time_keys = _HEADER_DATE_TIME_KEYS
+        except KeyError:
+            pass
+
+    if date_time_args is None:
+        date_time_keys = tuple(k for k in _DATE_TIME_KEYS if k in dd)
+        if not date_time_keys:
+            # if no datetime keys are found, return the dictionary as is
+            return dd
 
     try:
-        dd[date_time_key] = datetime.datetime(**date_time_args)
+        if date_time_args is not None:
+            dd[date_time_key] = datetime.datetime(*date_time_args)
+        else:
+            dd[date_time_key] = datetime.datetime(**{k: dd[k] for k in date_time_keys})
     except (ValueError, TypeError):
         if catch_datetime_exceptions:
             logger.warning(f"Could not parse datetime from {dd}")
@@ -206,11 +291,145 @@ def dict_elements_to_datetime(
             raise
 
     if delete_initial_keys:
-        [dd.pop(key, None) for key in ["hour", "minute", "second", "day", "month", "year"]]
+        for key in date_time_keys:
+            del dd[key]
 
     return dd
 
 
+# string header fields with few distinct values, which are interned by the
+# generated header parsers. Other fields, such as the registry number, are
+# unique to each record and interning them would only keep them alive.
+_INTERNED_HEADER_FIELDS: frozenset[str] = frozenset({"user_initials", "program_name", "dimensional_codes"})
+
+
+def _compile_header_layout(
+    header_format_string: str,
+    header_field_mapping: dict[str, tuple[str, Callable, Any]],
+) -> tuple[tuple[str, tuple[int, int], Callable, Any], ...]:
+    """Compile a header format string and field mapping into the list of
+    fields to extract from a header line.
+
+    Parameters
+    ----------
+    header_format_string : str
+        See get_mol_block_metadata for more information.
+    header_field_mapping : dict[str, tuple(str, Callable, Any)]
+        See get_mol_block_metadata for more information.
+
+    Returns
+    -------
+    tuple[tuple[str, tuple[int, int], Callable, Any], ...]
+        A tuple of (field name, character index, data type, default value) for
+        each field in the header line.
+    """
+
+    layout = []
+    for letter, character_index in _parse_format_string(header_format_string):
+        if letter not in header_field_mapping:
+            raise ValueError(f"The letter {letter} does not appear in the format field mapping.")  # noqa: E501
+        field_name = header_field_mapping[letter][0]
+        data_type = header_field_mapping[letter][1]
+        try:
+            default_value = header_field_mapping[letter][2]
+        except IndexError:
+            default_value = None
+        default_value = _default_line_item(data_type, default_value)
+        layout.append((field_name, character_index, data_type, default_value))
+
+    return tuple(layout)
+
+
+# cache of generated header line parsers, keyed on the format string and the id
+# of the field mapping. The mapping is stored with the parser so its id cannot
+# be reused while the entry exists. Keying on the id rather than the contents
+# of the mapping keeps the lookup for each header line cheap. The oldest entry
+# is dropped when the cache is full, so callers creating a new field mapping
+# for each call don't grow it without limit.
+_HEADER_CACHE_SIZE: int = 16
+_HEADER_PARSER_CACHE: dict[tuple[str, int], tuple[dict, Callable[[str], dict[str, Any]]]] = {}
+
+
+def _get_header_parser(
+    header_format_string: str,
+    header_field_mapping: dict[str, tuple[str, Callable, Any]],
+) -> Callable[[str], dict[str, Any]]:
+    """Return a function that extracts the fields of a header line.
+
+    The function is generated from the compiled header layout, with the
+    character indexes of each field written in as constants, so a header line
+    is parsed without looping over the layout. Each field is handled as by
+    get_line_item: the slice is stripped, empty fields take the default and
+    other fields are cast to the field type. Parsers are cached per format
+    string and mapping, so field mappings should not be modified once used.
+
+    Parsing many header lines column by column, in python or with numpy
+    string arrays, was measured to be slower than calling this per line.
+
+    Parameters
+    ----------
+    header_format_string : str
+        See get_mol_block_metadata for more information.
+    header_field_mapping : dict[str, tuple(str, Callable, Any)]
+        See get_mol_block_metadata for more information.
+
+    Returns
+    -------
+    Callable[[str], dict[str, Any]]
+        A function taking a header line and returning a dictionary of the
+        fields in it.
+    """
+
+    cache_key = (header_format_string, id(header_field_mapping))
+    cached = _HEADER_PARSER_CACHE.get(cache_key)
+    if cached is not None:
+        return cached[1]
+
+    # field names, types and defaults are passed in through the namespace of
+    # the generated function so any value can be used
+    namespace: dict[str, Any] = {"intern": sys.intern}
+    lines = ["def parse_header_line(line):"]
+    items = []
+    layout = _compile_header_layout(header_format_string, header_field_mapping)
+    for ii, (field_name, (start, end), data_type, default_value) in enumerate(layout):
+        namespace[f"name_{ii}"] = field_name
+        namespace[f"type_{ii}"] = data_type
+        namespace[f"default_{ii}"] = default_value
+        lines.append(f"    value_{ii} = line[{start}:{end}].strip()")
+        if data_type and data_type is not str:
+            items.append(f"name_{ii}: type_{ii}(value_{ii}) if value_{ii} else default_{ii}")
+        elif field_name in _INTERNED_HEADER_FIELDS:
+            # these values repeat across records, intern them so each record
+            # doesn't hold its own copy
+            items.append(f"name_{ii}: intern(value_{ii}) if value_{ii} else default_{ii}")
+        else:
+            items.append(f"name_{ii}: value_{ii} or default_{ii}")
+    lines.append(f"    return {{{', '.join(items)}}}")
+
+    exec("\n".join(lines), namespace)
+    parse_header_line = namespace["parse_header_line"]
+    # whether the parsed fields need converting with dict_elements_to_datetime
+    parse_header_line.has_date_time = any(field[0] in _DATE_TIME_KEYS for field in layout)
+    if len(_HEADER_PARSER_CACHE) >= _HEADER_CACHE_SIZE:
+        # dicts keep insertion order, so the first key is the oldest
+        del _HEADER_PARSER_CACHE[next(iter(_HEADER_PARSER_CACHE))]
+    _HEADER_PARSER_CACHE[cache_key] = (header_field_mapping, parse_header_line)
+
+    return parse_header_line
+
+
+# the default header line formats, whose parsers are generated at import
+# rather than when the first block is parsed
+_DEFAULT_HEADER_FORMAT_STRINGS: tuple[str, ...] = (
+    CTF_DEFAULT_MOLBLOCK_HEADER_FORMAT_STRING,
+    CTF_RXNBLOCK_HEADER_FORMAT_STRING,
+    CTF_COMPONENT_COUNT_FORMAT_STRING,
+)
+for _header_format_string in _DEFAULT_HEADER_FORMAT_STRINGS:
+    _get_header_parser(_header_format_string, CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+del _header_format_string
+
+
 def _parse_block_header_line(
     header_line: str,
     header_format_string: str,
@@ -234,30 +453,23 @@ def _parse_block_header_line(
         A dictionary of metadata.
     """
 
-    format_string_dict = parse_format_string(header_format_string)
-
-    metadata = {}
-    for letter, character_index in format_string_dict.items():
-        if letter in header_field_mapping:
-            field_name = header_field_mapping[letter][0]
-            data_type = header_field_mapping[letter][1]
-            try:
-                default_value = header_field_mapping[letter][2]
-            except IndexError:
-                default_value = None
-            metadata[field_name] = get_line_item(header_line, character_index, data_type, default_value)
-        else:
-            raise ValueError(f"The letter {letter} does not appear in the format field mapping.")  # noqa: E501
+    parse_header_line = _get_header_parser(header_format_string, header_field_mapping)
+    metadata = parse_header_line(header_line)
 
-    metadata = dict_elements_to_datetime(metadata)
+    if parse_header_line.has_date_time:
+        metadata = dict_elements_to_datetime(metadata)
 
     return metadata
 
 
+@functools.lru_cache(maxsize=4096)
 def make_string_python_safe(string: str) -> str:
     """Remove/replace characters that are not allowed in python
     variable/function names.
 
+    Results are cached, as the same dtype names are repeated in every record
+    of a rdf file.
+
     Parameters
     ----------
     string : str
@@ -272,9 +484,7 @@ def make_string_python_safe(string: str) -> str:
     if string is None:
         return None
 
-    string = string.strip()
-    string = string.strip("\n")
-    string = string.strip("\r")
+    string = string.strip()  # also removes newlines
 
     if string == "":
         return None
@@ -287,10 +497,10 @@ def make_string_python_safe(string: str) -> str:
         string = f"_{string}"
 
     # replace all non-alphanumeric characters with an underscore
-    string = re.sub(r"[^a-zA-Z0-9_]", "_", string)
+    string = string.translate(_PYTHON_NAME_TRANSLATION_TABLE)
 
     # replace multiple underscores with a single underscore
-    string = re.sub(r"_{2,}", "_", string)
+    string = _MULTIPLE_UNDERSCORE_RE.sub("_", string)
 
     # lower case the string
     string = string.lower()
@@ -317,21 +527,18 @@ def parse_yield(yield_string: str) -> float:
     float
         Yield as a float.
     """
-    re_patterns = [
-        r"^([0-9]+\.?[0-9]?)$",  # matches a single int or float
-        r"^([0-9]+\.?[0-9]?)\s{0,}[-,;:]{0,}\s{0,}([0-9]+\.?[0-9]?)$",  # matches two ints or floats separated by a dash, comma, semicolon, colon or space  # noqa: E501
-    ]
-
-    for re_pattern in re_patterns:
-        match = re.search(re_pattern, yield_string)
-        if match:
-            # get the match groups as a list
-            # (first match group is the whole string)
-            match_groups = match.groups()
-            # convert the match groups to floats
-            match_groups = [float(group) for group in match_groups]
-            # average the match groups
-            return sum(match_groups) / len(match_groups)
+    stripped_yield_string = yield_string.strip()
+
+    if stripped_yield_string.replace(".", "", 1).isdecimal():
+        # a single int or float, by far the most common format
+        return float(stripped_yield_string)
+
+    # otherwise a range of two numbers, parsed with one anchored match
+    match = _YIELD_RANGE_RE.match(stripped_yield_string)
+    if match:
+        lower, upper = match.groups()
+        # average the two ends of the range
+        return (float(lower) + float(upper)) / 2
 
     # if we get here, then we didn't find a match
     logger.warning(f"Could not parse yield from '{yield_string}'. Returning None.")
@@ -1,33 +1,49 @@
+import functools
+import mmap
+import os
+
 # typing
-from io import TextIOWrapper
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
 
 from rdfreader.chem.reaction import Reaction
+from rdfreader.parallel import process_map
 from rdfreader.parse.utils import CTF_RXNBLOCK_HEADER_FORMAT_STRING
 
+# the start of each reaction record in a rdf file
+_RFMT: str = "$RFMT"
+_RFMT_BYTES: bytes = _RFMT.encode()
+_RFMT_LEN: int = len(_RFMT)
+
+# the number of bytes (or characters, for text files) read from the file at a
+# time when looking for the next record
+_READ_SIZE: int = 1 << 20
+
 
 def parse_rdf_reg_num(line: str):
-    return line.replace("$RFMT $RIREG ", "").strip()
+    # removeprefix only checks the start of the line, unlike replace
+    return line.removeprefix("$RFMT $RIREG ").strip()
 
 
 class RDFParser:
-    _header_retrieved: bool = False
-    lineno: int = 1
-    rdf_metadata: dict[str, str] = {}
-
     def __init__(
         self,
-        f: TextIOWrapper,
+        f: IO,
         header_format_string: str = CTF_RXNBLOCK_HEADER_FORMAT_STRING,
         except_on_invalid_molecule: bool = True,
         except_on_invalid_reaction: bool = True,
         parse_conditions: bool = True,
+        encoding: str = "utf-8",
+        mode: str = "reaction",
     ):
         """
         Parameters
         ----------
-        f : TextIOWrapper
-            The file to parse.
+        f : IO
+            The file to parse, opened in text or binary mode, or a memory map
+            of the file. Binary files are faster to read, each reaction record
+            is decoded in one go.
         header_format_string : str, optional
             The format string to use to parse the header of each rxn block.
         except_on_invalid_molecule : bool, optional
@@ -38,14 +54,93 @@ class RDFParser:
             The name of the rdf file.
         parse_conditions : bool, optional
             Whether to parse the conditions of the reaction.
+        encoding : str, optional
+            The encoding used to decode binary files. Not used for text
+            files.
+        mode : str, optional
+            "reaction" to yield Reaction objects, or "raw" to yield
+            (rxn_block, rxn_id) tuples without parsing the rxn blocks.
         """
 
+        if mode not in ("reaction", "raw"):
+            raise ValueError(f"Invalid mode {mode!r}, expected 'reaction' or 'raw'.")
+
         self.f = f
         self.header_format_string = header_format_string
         self.except_on_invalid_molecule = except_on_invalid_molecule
         self.except_on_invalid_reaction = except_on_invalid_reaction
-        self.rdf_file_name = Path(f.name).name
+        self.rdf_file_name = Path(f.name).name if hasattr(f, "name") else None
         self.parse_conditions = parse_conditions
+        self.encoding = encoding
+        self.mode = mode
+        self.lineno: int = 1
+        # files are treated as binary or text by what they return, as text
+        # file wrappers such as tempfile and codecs files are not TextIOBase
+        first_line: Union[str, bytes] = self._readline()
+        self._binary: bool = isinstance(first_line, bytes)
+        self._record_start: Union[str, bytes] = _RFMT_BYTES if self._binary else _RFMT
+        self._newline: Union[str, bytes] = b"\n" if self._binary else "\n"
+        self._record_separator: Union[str, bytes] = self._newline + self._record_start
+        # text read from the file, records before _position have been parsed
+        self._buffer: Union[str, bytes] = self._record_start[:0]
+        self._position: int = 0
+        self.rdf_metadata: dict[str, str] = self._header(first_line)
+        # memory mapped files are searched for records in place, starting
+        # after the header, rather than being read into the buffer in chunks
+        self._mapped: bool = isinstance(f, mmap.mmap)
+        if self._mapped:
+            self._buffer = f
+            self._position = f.tell()
+
+    @classmethod
+    def from_path(cls, rdf_path: Union[str, Path], **kwargs: Any) -> "RDFParser":
+        """Create a parser for a rdf file, reading it through a memory map.
+
+        Records are found and sliced out of the mapped file directly, rather
+        than being read into a buffer in chunks. The mapping is released when
+        the parser is closed, e.g. by using it as a context manager:
+
+        >>> with RDFParser.from_path("reactions.rdf") as rdf_parser:
+        ...     reactions = list(rdf_parser)
+
+        Parameters
+        ----------
+        rdf_path : Union[str, Path]
+            The path to the rdf file.
+        **kwargs
+            Passed to RDFParser, e.g. except_on_invalid_reaction.
+
+        Returns
+        -------
+        RDFParser
+            The parser.
+        """
+        with open(rdf_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # empty files can't be memory mapped
+                rdf_file = BytesIO()
+            else:
+                # the mapping stays valid after the file is closed
+                rdf_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            parser = cls(rdf_file, **kwargs)
+        except Exception:
+            rdf_file.close()
+            raise
+        parser.rdf_file_name = Path(rdf_path).name
+        return parser
+
+    def close(self) -> None:
+        """Close the file being parsed, or release the memory map for parsers
+        created with from_path."""
+        self._buffer = self._record_start[:0]
+        self.f.close()
+
+    def __enter__(self) -> "RDFParser":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def __iter__(self):
         return self
@@ -69,32 +164,78 @@ class RDFParser:
         """
 
         # get the next rxn block
-        reaction = None
-        rxn_block, rxn_id, start_lineno = self._next_rxn_block()
-        try:
-            reaction = Reaction(
-                rxn_block=rxn_block,
-                id=rxn_id,
-                rdf_metadata=self.rdf_metadata,
-                header_format_string=self.header_format_string,
-                except_on_invalid_molecule=self.except_on_invalid_molecule,
-                lineno=start_lineno,
-                rdf_file=self.rdf_file_name,
-            )
+        record = self._next_rxn_block()
+        if self.mode == "raw":
+            rxn_block, rxn_id, _ = record
+            return rxn_block, rxn_id
+        return _build_reaction(record, self._reaction_kwargs(), self.except_on_invalid_reaction)
+
+    def iter_blocks(self) -> Iterator[tuple[str, str, int]]:
+        """Yield the remaining records in the file without parsing them.
+
+        Returns
+        -------
+        Iterator[tuple[str, str, int]]
+            The rxn block, the rxn id, and the line number of the start of the
+            rxn block, for each record.
+        """
+        while True:
+            try:
+                yield self._next_rxn_block()
+            except StopIteration:
+                return
+
+    def parse_parallel(
+        self, processes: Optional[int] = None, chunksize: int = 64
+    ) -> Iterator[Union[Optional[Reaction], tuple[str, str]]]:
+        """Parse the remaining reactions in the file using a pool of
+        processes.
+
+        The file is read in this process and the rxn blocks are sent to the
+        workers to be parsed. Reactions are yielded in file order, as for
+        iterating over the parser, and the file is read as they are yielded.
+        In raw mode there is nothing to parse, so the records are yielded
+        without using a pool.
+
+        Parameters
+        ----------
+        processes : int, optional
+            The number of worker processes. Defaults to the number of CPUs.
+        chunksize : int, optional
+            The number of rxn blocks sent to a worker at a time.
 
-        except Exception as e:
-            if self.except_on_invalid_reaction:
-                raise e
+        Returns
+        -------
+        Iterator[Union[Optional[Reaction], tuple[str, str]]]
+            The reactions, or (rxn_block, rxn_id) tuples in raw mode. Invalid
+            reactions are None if except_on_invalid_reaction is False.
+        """
+        if self.mode == "raw":
+            return ((rxn_block, rxn_id) for rxn_block, rxn_id, _ in self.iter_blocks())
+        build_reaction = functools.partial(
+            _build_reaction,
+            reaction_kwargs=self._reaction_kwargs(),
+            except_on_invalid_reaction=self.except_on_invalid_reaction,
+        )
+        return process_map(build_reaction, self.iter_blocks(), processes=processes, chunksize=chunksize)
 
-        return reaction
+    def _reaction_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments used to create each reaction, other
+        than those taken from the record."""
+        return dict(
+            rdf_metadata=self.rdf_metadata,
+            header_format_string=self.header_format_string,
+            except_on_invalid_molecule=self.except_on_invalid_molecule,
+            rdf_file=self.rdf_file_name,
+        )
 
-    def _header(self):
+    def _header(self, first_line: Union[str, bytes]) -> dict[str, str]:
         """Parse the header of a RDF file.
 
         Parameters
         ----------
-        f : TextIOWrapper
-            The file to parse.
+        first_line : Union[str, bytes]
+            The first line of the file, already read to find the file mode.
 
         Returns
         -------
@@ -103,11 +244,9 @@ class RDFParser:
             strings as they are typically ignored and the structure of the
             datetime field is not defined in the specification.
         """
-        if not self._header_retrieved:
-            self._header_retrieved = True
-            version = self._readline()[8:].strip()
-            date_stamp = self._readline()[6:].strip()
-            self.rdf_metadata = {"version": version, "date_stamp": date_stamp}
+        version = self._decode(first_line)[8:].strip()
+        date_stamp = self._decode(self._readline())[6:].strip()
+        return {"version": version, "date_stamp": date_stamp}
 
     def _next_rxn_block(self) -> tuple[str, str, int]:
         """Returns the next rxn block from a rdf file. If the end.
@@ -119,36 +258,201 @@ class RDFParser:
             rxn block.
         """
 
-        self._header()
         start_lineno: int = self.lineno
-        line: str = self._readline()
-        if line == "":
+        record = self._read_record()
+        if not record:
             raise StopIteration
-        # parse the rxn block deliminators
-        if line.startswith("$RFMT"):
-            # capture the reg number
-            reg_no: str = parse_rdf_reg_num(line)
-            line: str = self._readline()
-        else:
+        # the record starts with the $RFMT line, which holds the reg number,
+        # followed by the rxn block
+        rfmt_line, _, rxn_block = record.partition(self._newline)
+        if rfmt_line[:_RFMT_LEN] != self._record_start:
             #  there is a problem with the file format, raise an exception
-            raise Exception(f"Invalid RDF file format. Expected $RFMT, got {line} " f"at line {self.lineno}")
+            raise Exception(
+                f"Invalid RDF file format. Expected $RFMT, got {self._decode(rfmt_line)} " f"at line {start_lineno}"
+            )
+        reg_no: str = parse_rdf_reg_num(self._decode(rfmt_line))
+        self.lineno += record.count(self._newline)
 
-        # capture the rxn block
-        rxn_block: str = ""
-        f_last_pos = self.f.tell()  # ensure f_last_pos is defined
-        while not line.startswith("$RFMT") and not line == "":
-            f_last_pos = self.f.tell()
-            rxn_block += line
-            line: str = self._readline()
+        return self._decode(rxn_block), reg_no, start_lineno
 
-        # send the file pointer back one line so it is at the start of the
-        # next rxn block
-        self.f.seek(f_last_pos)
-        self.lineno -= 1
+    def _read_record(self) -> Union[str, bytes]:
+        """Return the next record in the file, from the start of its $RFMT
+        line up to the start of the next record, or the end of the file.
 
-        return rxn_block, reg_no, start_lineno
+        The file is read in large chunks and the next record separator found
+        with a single find, rather than reading and checking each line. Memory
+        mapped files are searched directly.
+        """
+        buffer = self._buffer
+        start = self._position
+        search_from = start
+        while True:
+            end = buffer.find(self._record_separator, search_from)
+            if end != -1:
+                # keep the newline at the end of the record
+                self._position = end + 1
+                return buffer[start : end + 1]
+            chunk = None if self._mapped else self.f.read(_READ_SIZE)
+            if not chunk:
+                self._position = len(buffer)
+                return buffer[start:]
+            # drop the consumed records from the buffer and search on from
+            # where a separator split across the two chunks could start
+            search_from = max(len(buffer) - start - len(self._record_separator) + 1, 0)
+            buffer = self._buffer = buffer[start:] + chunk
+            start = 0
 
     def _readline(self):
-        """Wraps f.read and increments the line number."""
+        """Wraps f.readline and increments the line number."""
         self.lineno += 1
         return self.f.readline()
+
+    def _decode(self, text: Union[str, bytes]) -> str:
+        """Decode text read from a binary file.
+
+        Windows line endings are converted to newlines, as when reading a text
+        file. Text read from a text file is returned unchanged.
+        """
+        if not self._binary:
+            return text
+        return text.decode(self.encoding).replace("\r\n", "\n")
+
+
+def _build_reaction(
+    record: tuple[str, str, int],
+    reaction_kwargs: dict[str, Any],
+    except_on_invalid_reaction: bool,
+) -> Optional[Reaction]:
+    """Create a reaction from a record read by RDFParser.
+
+    Parameters
+    ----------
+    record : tuple[str, str, int]
+        The rxn block, the rxn id, and the line number of the start of the rxn
+        block.
+    reaction_kwargs : dict[str, Any]
+        Other keyword arguments passed to Reaction.
+    except_on_invalid_reaction : bool
+        If False, None is returned instead of raising an exception if the
+        reaction is invalid.
+
+    Returns
+    -------
+    Optional[Reaction]
+        The reaction.
+    """
+    rxn_block, rxn_id, start_lineno = record
+    try:
+        return Reaction(rxn_block=rxn_block, id=rxn_id, lineno=start_lineno, **reaction_kwargs)
+    except Exception as e:
+        if except_on_invalid_reaction:
+            raise e
+    return None
+
+
+def parse_rdf_parallel(
+    rdf_path: Union[str, Path],
+    processes: Optional[int] = None,
+    encoding: str = "utf-8",
+    **kwargs: Any,
+) -> Iterator[Optional[Reaction]]:
+    """Parse a RDF file using a pool of processes.
+
+    The file is split into ranges of whole reaction records (at $RFMT lines),
+    which are parsed in separate processes by RDFParser. Reactions are
+    yielded in the order they appear in the file, with the same ids, line
+    numbers and metadata as from RDFParser.
+
+    Parameters
+    ----------
+    rdf_path : str | Path
+        The path of the rdf file.
+    processes : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+    encoding : str, optional
+        The encoding of the file.
+    **kwargs
+        Passed to RDFParser, e.g. except_on_invalid_reaction.
+
+    Returns
+    -------
+    Iterator[Optional[Reaction]]
+        The reactions in the file. As with RDFParser, invalid reactions are
+        None if except_on_invalid_reaction is False.
+    """
+
+    if os.path.getsize(rdf_path) == 0:
+        return
+
+    processes = processes or os.cpu_count() or 1
+    # split into more ranges than processes to balance the work
+    n_ranges = processes * 4
+
+    ranges: list[tuple[int, int, int]] = []  # (start, end, lineno) of each range
+    with open(rdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        record_delimiter = b"\n$RFMT"
+        start = mm.find(record_delimiter) + 1
+        if start == 0:
+            # no reactions in the file
+            return
+        # the file header is parsed by each worker along with its range
+        header = mm[:start]
+        lineno = header.count(b"\n") + 1
+        range_size = max((len(mm) - start) // n_ranges, 1)
+        while start < len(mm):
+            end = mm.find(record_delimiter, start + range_size) + 1 or len(mm)
+            ranges.append((start, end, lineno))
+            lineno += mm[start:end].count(b"\n")
+            start = end
+
+    for reactions in process_map(
+        _parse_rdf_range,
+        *zip(*[(rdf_path, header, start, end, lineno, encoding, kwargs) for start, end, lineno in ranges]),
+        processes=processes,
+    ):
+        yield from reactions
+
+
+def _parse_rdf_range(
+    rdf_path: Union[str, Path],
+    header: bytes,
+    start: int,
+    end: int,
+    lineno: int,
+    encoding: str,
+    parser_kwargs: dict[str, Any],
+) -> list[Optional[Reaction]]:
+    """Parse the reaction records between two byte offsets of a rdf file.
+
+    Parameters
+    ----------
+    rdf_path : str | Path
+        The path of the rdf file.
+    header : bytes
+        The header of the rdf file, before the first $RFMT line.
+    start : int
+        The offset of the first $RFMT line of the range.
+    end : int
+        The offset of the end of the range.
+    lineno : int
+        The line number of the first line of the range.
+    encoding : str
+        The encoding of the file.
+    parser_kwargs : dict[str, Any]
+        Passed to RDFParser.
+
+    Returns
+    -------
+    list[Optional[Reaction]]
+        The reactions in the range.
+    """
+
+    with open(rdf_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    parser = RDFParser(BytesIO(header + data), encoding=encoding, **parser_kwargs)
+    parser.lineno = lineno
+    parser.rdf_file_name = Path(rdf_path).name
+
+    return list(parser)
@@ -1,21 +1,26 @@
+import itertools
 from datetime import datetime
 from io import TextIOWrapper
+from typing import Iterable, Optional
 
 
 def write_rdf(
     f: TextIOWrapper,
-    rxn_blocks: list[str],
-    rxn_ids: list[str] = None,
+    rxn_blocks: Iterable[str],
+    rxn_ids: Optional[Iterable[str]] = None,
 ):
-    """Write a RDF file from a list of reaction blocks.
+    """Write a RDF file from reaction blocks.
+
+    Reaction blocks are written as they are read from rxn_blocks, so it can
+    be a generator.
 
     Parameters
     ----------
     f : TextIOWrapper
         The file to write to.
-    rxn_blocks : list[str]
+    rxn_blocks : Iterable[str]
         The reaction blocks to write.
-    rxn_ids : list[str], optional
+    rxn_ids : Iterable[str], optional
         The reaction IDs to use. Defaults to None. If None, sequential 5 digit
         numbers are used.
     """
@@ -23,14 +28,14 @@ def write_rdf(
     datm = datetime.now().strftime("%d/%m/%y %H:%M")
 
     rdf_header = f"$RDFILE 1\n$DATM {datm}\n"
-    rxn_header = "$RFMT $RIREG {}\n"
 
     if rxn_ids is None:
         # generate sequential 5 digit numbers
-        rxn_ids = [f"{i:05d}" for i in range(1, len(rxn_blocks) + 1)]
+        rxn_ids = (f"{i:05d}" for i in itertools.count(1))
 
     f.write(rdf_header)
 
+    # each record is built with a single f-string and written with one call
+    write = f.write
     for rxn_id, rxn_block in zip(rxn_ids, rxn_blocks):
-        f.write(rxn_header.format(rxn_id))
-        f.write(rxn_block)
+        write(f"$RFMT $RIREG {rxn_id}\n{rxn_block}")
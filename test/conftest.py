@@ -1,4 +1,5 @@
 import datetime
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,7 @@ def mocker(mocker_fixture) -> MockerFixture:  # noqa: F811
     return mocker_fixture
 
 
+@functools.lru_cache(maxsize=None)
 def get_sample_mol_block() -> str:
     """Load the sample mol block as a string from the test resources."""
     sample_mol_block_path = "test/resources/sample_mol_block.txt"
@@ -23,18 +25,19 @@ def get_sample_mol_block() -> str:
     return sample_mol_block
 
 
+@functools.lru_cache(maxsize=None)
 def get_rdf_path() -> Path:
     """Load the sample rdf as a string from the test resources."""
     rdf_path = Path("test/resources/sample_rdf.rdf")
     return rdf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rdf_path() -> Path:
     return get_rdf_path()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def first_sample_rxn() -> str:
     """Return the first rxn block from the sample rdf."""
     with open("test/resources/sample_rdf_first_rxn.rxn", "r") as f:
@@ -42,6 +45,7 @@ def first_sample_rxn() -> str:
     return first_sample_rxn
 
 
+@functools.lru_cache(maxsize=None)
 def get_sample_rdf_string() -> str:
     """Load the sample rdf as a string from the test resources."""
     sample_rdf_string_path = get_rdf_path()
@@ -50,6 +54,7 @@ def get_sample_rdf_string() -> str:
     return sample_rdf_string
 
 
+@functools.lru_cache(maxsize=None)
 def get_sample_rxn_block() -> str:
     """Load the sample rxn block as a string from the test resources."""
     sample_rxn_block_path = "test/resources/sample_rxn_block.txt"
@@ -58,37 +63,37 @@ def get_sample_rxn_block() -> str:
     return sample_rxn_block
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mol_block() -> str:
     return get_sample_mol_block()
 
 
-@pytest.fixture
-def sample_mol_block_lines() -> str:
+@pytest.fixture(scope="session")
+def sample_mol_block_lines() -> tuple[str, ...]:
     """Return the sample mol block split into a list of lines."""
-    return get_sample_mol_block().split("\n")
+    return tuple(get_sample_mol_block().split("\n"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rxn_block() -> str:
     return get_sample_rxn_block()
 
 
-@pytest.fixture
-def sample_rxn_block_lines() -> str:
+@pytest.fixture(scope="session")
+def sample_rxn_block_lines() -> tuple[str, ...]:
     """Return the sample rxn block split into a list of lines."""
-    return get_sample_rxn_block().split("\n")
+    return tuple(get_sample_rxn_block().split("\n"))
 
 
 @pytest.fixture
-def sample_molecule() -> Molecule:
-    """Create a test molecule."""
+def sample_molecule(sample_mol_block: str) -> Molecule:
+    """Create a test molecule. Function scoped as tests may modify it."""
     mol = Molecule()
-    mol.mol_block = get_sample_mol_block()
+    mol.mol_block = sample_mol_block
     return mol
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_molecule_metadata() -> dict[str, Any]:
     """Return the sample mol block metadata."""
     return dict(
@@ -105,7 +110,7 @@ def sample_molecule_metadata() -> dict[str, Any]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rxn_block_metadata() -> str:
     """Return sample rxn block metadata."""
     return dict(
@@ -1,6 +1,10 @@
-from rdkit.Chem import Mol, MolFromMolBlock, MolToSmiles
+import pickle
 
-from rdfreader.chem.mol import Molecule
+import pytest
+from rdkit.Chem import Mol, MolFromMolBlock, MolFromSmiles, MolToMolBlock, MolToSmiles
+
+from rdfreader.chem.mol import Catalyst, Molecule, Product, Reactant, Solvent
+from rdfreader.exceptions import InvalidMoleculeError
 
 
 def assert_molecule_from_mol_block(mol: Molecule, mol_block: str):
@@ -61,3 +65,92 @@ def test_molecule_from_smiles():
     mol = Molecule.from_smiles(smiles)
     assert mol.rd_mol is not None
     assert mol.smiles == smiles
+
+
+def test_molecule_rd_mol_is_cached(sample_molecule):
+    """Test the RDKit molecule is only created once per mol block."""
+    assert sample_molecule.rd_mol is sample_molecule.rd_mol
+
+
+def test_molecule_cache_cleared_on_new_mol_block(sample_molecule):
+    """Test that setting a new mol block discards the cached values."""
+    sample_molecule.smiles  # populate the cache
+    sample_molecule.mol_block = Molecule.from_smiles("OCO").mol_block
+    assert sample_molecule.smiles == "OCO"
+    assert sample_molecule.metadata["program_name"] == "RDKit"
+
+
+def test_molecule_properties_not_shared(sample_mol_block):
+    """Test that molecules created without properties do not share a
+    properties dictionary."""
+    mol_1 = Molecule.from_mol_block(sample_mol_block, {"name": "mol_1"})
+    mol_2 = Molecule.from_mol_block(sample_mol_block)
+    assert mol_1.properties == {"name": "mol_1"}
+    assert mol_2.properties == {}
+
+
+@pytest.mark.parametrize(
+    "molecule_class, component_type",
+    [(Reactant, "reactant"), (Product, "product"), (Solvent, "solvent"), (Catalyst, "catalyst")],
+)
+def test_molecule_subclass_component_type(sample_mol_block, molecule_class, component_type):
+    mol = molecule_class(sample_mol_block)
+    assert mol.component_type == component_type
+    assert mol.mol_block == sample_mol_block
+
+
+@pytest.mark.parametrize("molecule_class", [Molecule, Reactant, Product, Solvent, Catalyst])
+def test_molecule_has_no_instance_dict(sample_mol_block, molecule_class):
+    """Molecules use __slots__, check no class in the hierarchy adds a
+    __dict__."""
+    mol = molecule_class(sample_mol_block)
+    assert not hasattr(mol, "__dict__")
+    with pytest.raises(AttributeError):
+        mol.not_an_attribute = None
+
+
+def test_molecule_pickle(sample_molecule):
+    """Test that molecules, including their cached values, can be
+    pickled."""
+    sample_molecule.smiles  # populate the cache
+    mol = pickle.loads(pickle.dumps(sample_molecule))
+    assert mol.mol_block == sample_molecule.mol_block
+    assert mol.smiles == sample_molecule.smiles
+    # properties RDKit reads from the mol block, e.g. _Name, are kept
+    assert mol.rd_mol.GetPropsAsDict(True, False) == sample_molecule.rd_mol.GetPropsAsDict(True, False)
+    assert mol.rd_mol.GetProp("_Name") == "sample name"
+
+
+def test_molecule_eq_same_molecule_different_mol_block():
+    """Test molecules are compared by SMILES rather than by mol block."""
+    mol_1 = Molecule.from_smiles("OCO")
+    mol_2 = Molecule.from_smiles("C(O)O")
+    assert not mol_1.eq_raw(mol_2)
+    assert mol_1 == mol_2
+    assert hash(mol_1) == hash(mol_2)
+    assert len({mol_1, mol_2}) == 1
+
+
+def test_molecule_eq_different_molecules():
+    assert Molecule.from_smiles("OCO") != Molecule.from_smiles("CO")
+    assert Molecule.from_smiles("OCO") != "OCO"
+
+
+def test_molecule_eq_raw(sample_mol_block):
+    assert Molecule(sample_mol_block).eq_raw(Molecule(sample_mol_block))
+
+
+def test_molecule_invalid_mol_block_raises():
+    with pytest.raises(InvalidMoleculeError):
+        Molecule("not a mol block")
+
+
+def test_molecule_unsanitizable_mol_block_raises():
+    """Test a mol block that can be read but not sanitized raises, and gives
+    no RDKit molecule when invalid molecules are allowed."""
+    mol_block = MolToMolBlock(MolFromSmiles("C(C)(C)(C)(C)C", sanitize=False))
+    with pytest.raises(InvalidMoleculeError):
+        Molecule(mol_block)
+    mol = Molecule(mol_block, except_on_invalid_molecule=False)
+    assert mol.rd_mol is None
+    assert mol.smiles is None
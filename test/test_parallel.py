@@ -0,0 +1,18 @@
+from rdfreader.parallel import process_map
+
+
+def test_process_map_reads_lazily():
+    """Test that process_map yields results in order without reading the
+    whole input first."""
+    items_read = []
+
+    def items():
+        for ii in range(1000):
+            items_read.append(ii)
+            yield ii
+
+    results = process_map(str, items(), processes=2, chunksize=4)
+    assert next(results) == "0"
+    # at most two chunks per process are read ahead
+    assert len(items_read) <= 2 * 2 * 4
+    assert list(results) == [str(ii) for ii in range(1, 1000)]
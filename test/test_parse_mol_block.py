@@ -2,7 +2,11 @@ from rdfreader.parse.molblock import _parse_large_regno, get_mol_block_metadata
 
 
 def test_parse_large_regno():
-    assert _parse_large_regno(["", "M  REG     0123456    \n", ""]) == "0123456"
+    assert _parse_large_regno("\nM  REG     0123456    \nM  END\n") == "0123456"
+
+
+def test_parse_large_regno_absent():
+    assert _parse_large_regno("\nM  END\n") is None
 
 
 def test_get_mol_block_metadata(sample_mol_block, sample_molecule_metadata):
@@ -51,6 +51,9 @@ def test_datum_parser_rxnblock(sample_rxn_block):
         ("384991457334703", "$DATUM 384991457334703"),
         ("0040-4039", "$DATUM 0040-4039"),
         ("a\nmultiline\nstring", "$DATUM a\nmultiline\nstring"),
+        ("$MFMT\n", "$DATUM $MFMT\n"),
+        ("", "$DATUM"),
+        ("no prefix", "no prefix"),
     ],
 )
 def test_preprocess_datum_string(expected_datum_string, sample_datum_string):
@@ -2,11 +2,18 @@ import datetime
 
 import pytest
 
+import rdfreader.parse.utils as parse_utils
 from rdfreader.parse.utils import (
+    _DEFAULT_HEADER_FORMAT_STRINGS,
+    _HEADER_CACHE_SIZE,
+    _HEADER_PARSER_CACHE,
     CTF_DEFAULT_LETTER_TO_FIELD_MAPPING,
     CTF_DEFAULT_MOLBLOCK_HEADER_FORMAT_STRING,
     CTF_RXNBLOCK_HEADER_FORMAT_STRING,
+    _compile_header_layout,
     _default_line_item,
+    _first_n_lines,
+    _get_header_parser,
     _parse_block_header_line,
     dict_elements_to_datetime,
     get_line_item,
@@ -142,8 +149,25 @@ def test_dict_elements_to_datetime():
     assert dict_elements_to_datetime(elements) == expected_result
 
 
+@pytest.mark.parametrize(
+    "elements,expected_result",
+    [
+        (
+            {"year": 3, "month": 1, "day": 2, "hour": 4, "minute": 5, "second": 6},
+            {"date_time": datetime.datetime(3, 1, 2, 4, 5, 6)},
+        ),
+        ({"year": 3, "month": 1, "day": 2}, {"date_time": datetime.datetime(3, 1, 2)}),
+        ({"year": 3, "month": 1}, {"date_time": None}),
+        ({"test": "test"}, {"test": "test"}),
+    ],
+)
+def test_dict_elements_to_datetime_other_fields(elements, expected_result):
+    """Test datetime elements other than those of a header line."""
+    assert dict_elements_to_datetime(elements) == expected_result
+
+
 def test_parse_block_header_line_with_molblock(sample_mol_block_lines, sample_molecule_metadata):
-    expected_result = sample_molecule_metadata
+    expected_result = dict(sample_molecule_metadata)
     expected_result["registry_number"] = "RRRRRR"
     # This is the only thing that is different from the
     # sample_molecule_metadata as the large regno is parsed seperately.
@@ -181,7 +205,7 @@ def test_parse_block_header_line_with_molblock_defaults():
 
 
 def test_parse_block_header_line_with_rxnblock(sample_rxn_block_lines, sample_rxn_block_metadata):
-    expected_result = sample_rxn_block_metadata
+    expected_result = dict(sample_rxn_block_metadata)
     for absent_key in [
         "comment",
         "reaction_name",
@@ -222,12 +246,19 @@ def test_get_whole_line_item():
     assert get_whole_line_item(line) == "line"
 
 
+@pytest.mark.parametrize("line", ["", "   ", "\n"])
+def test_get_whole_line_item_empty(line: str):
+    """Test that an empty string is returned for a blank line."""
+    assert get_whole_line_item(line) == ""
+
+
 @pytest.mark.parametrize(
     "test_string,expected_result",
     [
         ("", None),
         (" ", None),
         (" \n\r1_:;'/test`string\n __", "_1_test_string"),
+        ("RXN:CONDITION(é)", "rxn_condition"),
     ],
 )
 def test_make_string_python_safe(test_string, expected_result):
@@ -235,6 +266,11 @@ def test_make_string_python_safe(test_string, expected_result):
     assert test_result == expected_result
 
 
+def test_make_string_python_safe_cached():
+    test_result = make_string_python_safe("RXN:VARIATION:PRODUCT:YIELD")
+    assert make_string_python_safe("RXN:VARIATION:PRODUCT:YIELD") is test_result
+
+
 def test_parse_yield():
     test_strings = [
         "17.0-17.0",
@@ -258,9 +294,86 @@ def test_parse_yield():
         assert parse_yield(test_string) == expected_result
 
 
+@pytest.mark.parametrize("test_string, expected_result", [("17.25", 17.25), (" 17 ", 17.0), ("0", 0.0)])
+def test_parse_yield_single_number(test_string, expected_result):
+    assert parse_yield(test_string) == expected_result
+
+
 def test_parse_yield_none():
     """Test that None is returned if the yield cannot be parsed."""
-    test_strings = ["some text", "-1"]
+    test_strings = ["some text", "-1", "", "nan", "1e5"]
 
     for test_string in test_strings:
         assert parse_yield(test_string) is None
+
+
+def test_default_header_parsers():
+    """Test that the parsers for the default header lines are generated at
+    import."""
+    for header_format_string in _DEFAULT_HEADER_FORMAT_STRINGS:
+        assert (header_format_string, id(CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)) in _HEADER_PARSER_CACHE
+
+
+def test_compile_header_layout():
+    layout = _compile_header_layout("IIrrr", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+    assert layout == (("user_initials", (0, 2), str, ""), ("reactant_count", (2, 5), int, 0))
+
+
+def test_get_header_parser():
+    parse_header_line = _get_header_parser("IIrrr", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+    assert parse_header_line("AB 12\n") == {"user_initials": "AB", "reactant_count": 12}
+    assert parse_header_line("") == {"user_initials": "", "reactant_count": 0}
+    # parsers are cached
+    assert _get_header_parser("IIrrr", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING) is parse_header_line
+
+
+def test_get_header_parser_cache_is_bounded(monkeypatch):
+    """Test that creating a new field mapping for each call doesn't grow the
+    parser cache without limit."""
+    parser_cache = {}
+    monkeypatch.setattr(parse_utils, "_HEADER_PARSER_CACHE", parser_cache)
+    for _ in range(_HEADER_CACHE_SIZE * 2):
+        _get_header_parser("IIrrr", dict(CTF_DEFAULT_LETTER_TO_FIELD_MAPPING))
+    assert len(parser_cache) == _HEADER_CACHE_SIZE
+
+
+def test_get_header_parser_has_date_time():
+    assert not _get_header_parser("IIrrr", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING).has_date_time
+    assert _get_header_parser(CTF_RXNBLOCK_HEADER_FORMAT_STRING, CTF_DEFAULT_LETTER_TO_FIELD_MAPPING).has_date_time
+
+
+def test_get_header_parser_interns_strings():
+    """Test that string values are shared between parsed header lines."""
+    parse_header_line = _get_header_parser("PPPPPPPPPP", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+    first = parse_header_line("  INFOCHEM")
+    second = parse_header_line("  INFOCHEM\n")
+    assert first["program_name"] == "INFOCHEM"
+    assert first["program_name"] is second["program_name"]
+
+
+def test_get_header_parser_does_not_intern_registry_number():
+    """Test that registry numbers, which are unique per record, are not
+    interned."""
+    parse_header_line = _get_header_parser("RRRRRRR", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+    first = parse_header_line(" 1234567")
+    second = parse_header_line(" 1234567\n")
+    assert first["registry_number"] == "123456"
+    assert first["registry_number"] is not second["registry_number"]
+
+
+def test_get_header_parser_casting_exceptions_thrown():
+    with pytest.raises(ValueError):
+        _get_header_parser("IIrrr", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)("ABxyz")
+
+
+def test_compile_header_layout_unknown_letter():
+    with pytest.raises(ValueError):
+        _compile_header_layout("IIXX", CTF_DEFAULT_LETTER_TO_FIELD_MAPPING)
+
+
+@pytest.mark.parametrize(
+    "string, n",
+    [("a\nb\nc\nd", 2), ("a\nb\n", 5), ("a\nb", 2), ("", 1), ("a\n\nb\n", 3)],
+)
+def test_first_n_lines(string, n):
+    assert _first_n_lines(string, n) == string.split("\n")[:n]
@@ -1,3 +1,6 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -5,19 +8,63 @@ from pytest_mock import MockerFixture
 
 from rdfreader.chem.reaction import Reaction
 from rdfreader.exceptions import InvalidReactionError
-from rdfreader.rdf import RDFParser, parse_rdf_reg_num
+from rdfreader.rdf import RDFParser, parse_rdf_parallel, parse_rdf_reg_num
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rdf_file() -> str:
     return "test/resources/spresi-100.rdf"
 
 
+@pytest.fixture(scope="session")
+def expected_reactions(sample_rdf_file: str) -> list[Reaction]:
+    """The reactions in the sample rdf file, parsed sequentially from a text
+    file. Read only, shared by the tests comparing other ways of parsing the
+    file."""
+    with open(sample_rdf_file, "r") as f:
+        return [reaction for reaction in RDFParser(f)]
+
+
+def assert_reactions_match(
+    reactions: list[Reaction], expected_reactions: list[Reaction], check_rdf_file: bool = True
+) -> None:
+    """Assert reactions were read from the same records as the expected
+    reactions."""
+    assert len(reactions) == len(expected_reactions)
+    for reaction, expected_reaction in zip(reactions, expected_reactions):
+        assert reaction.id == expected_reaction.id
+        assert reaction.lineno == expected_reaction.lineno
+        assert reaction.rdf_metadata == expected_reaction.rdf_metadata
+        if check_rdf_file:
+            assert reaction.rdf_file == expected_reaction.rdf_file
+        assert reaction.rxn_block == expected_reaction.rxn_block
+
+
+def assert_rd_mol_properties_match(reactions: list[Reaction], expected_reactions: list[Reaction]) -> None:
+    """Assert the RDKit molecules of each reaction have the same properties,
+    e.g. _Name, as the expected reactions, so none are lost when reactions are
+    sent between processes."""
+    for reaction, expected_reaction in zip(reactions, expected_reactions):
+        molecules = reaction.reactants + reaction.products + reaction.reagents
+        expected_molecules = expected_reaction.reactants + expected_reaction.products + expected_reaction.reagents
+        assert [mol.rd_mol.GetPropsAsDict(True, False) for mol in molecules] == [
+            mol.rd_mol.GetPropsAsDict(True, False) for mol in expected_molecules
+        ]
+
+
 def test_parse_rdf_reg_num():
     reg_num = parse_rdf_reg_num("$RFMT $RIREG 4620744")
     assert reg_num == "4620744"
 
 
+@pytest.mark.parametrize(
+    "line,expected_reg_num",
+    [("$RFMT $RIREG 4620744\n", "4620744"), ("$RFMT $RIREG  4620744 \r\n", "4620744")],
+)
+def test_parse_rdf_reg_num_whitespace(line: str, expected_reg_num: str):
+    assert parse_rdf_reg_num(line) == expected_reg_num
+
+
 def test_parse_rdf(sample_rdf_file: str):
     with open(sample_rdf_file, "r") as f:
         rdf_parser = RDFParser(f)
@@ -57,6 +104,125 @@ def test_parse_rdf(sample_rdf_file: str):
         assert len(reaction.other_reagents) == other_count
 
 
+def test_parse_rdf_binary(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that parsing a file opened in binary mode gives the same reactions
+    as in text mode."""
+    with open(sample_rdf_file, "rb") as f:
+        reactions = [reaction for reaction in RDFParser(f)]
+
+    assert_reactions_match(reactions, expected_reactions)
+
+
+def test_parse_rdf_text_file_wrapper(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that text files which are not TextIOBase instances, such as
+    tempfile wrappers, are read as text."""
+    with open(sample_rdf_file, "r") as f:
+        rdf_text = f.read()
+
+    with tempfile.NamedTemporaryFile("w+") as f:
+        f.write(rdf_text)
+        f.seek(0)
+        reactions = [reaction for reaction in RDFParser(f)]
+
+    # the temporary file has a different name
+    assert_reactions_match(reactions, expected_reactions, check_rdf_file=False)
+
+
+def test_parse_rdf_raw(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that raw mode yields the rxn blocks and ids that reactions are
+    created from."""
+    with open(sample_rdf_file, "r") as f:
+        records = [record for record in RDFParser(f, mode="raw")]
+
+    assert records == [(reaction.rxn_block, reaction.id) for reaction in expected_reactions]
+
+
+@pytest.mark.parametrize("file_mode", ["r", "rb"])
+def test_parse_rdf_small_reads(
+    mocker: MockerFixture, sample_rdf_file: str, file_mode: str, expected_reactions: list[Reaction]
+):
+    """Test that records split across the chunks read from the file are
+    parsed the same as when the whole file is read at once."""
+    mocker.patch("rdfreader.rdf._READ_SIZE", 7)
+    with open(sample_rdf_file, file_mode) as f:
+        reactions = [reaction for reaction in RDFParser(f)]
+
+    assert_reactions_match(reactions, expected_reactions)
+
+
+def test_parse_rdf_invalid_record():
+    """Test that an exception is raised if a record doesn't start with
+    $RFMT."""
+    rdf = StringIO("$RDFILE 1\n$DATM    02/12/04 11:58\n$RXN\n")
+    with pytest.raises(Exception, match="Expected \\$RFMT, got \\$RXN at line 3"):
+        next(RDFParser(rdf))
+
+
+def test_parse_rdf_invalid_mode(sample_rdf_file: str):
+    with pytest.raises(ValueError):
+        with open(sample_rdf_file, "r") as f:
+            RDFParser(f, mode="invalid")
+
+
+def test_parse_rdf_parallel(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that parsing in parallel gives the same reactions as parsing
+    sequentially."""
+    reactions = list(parse_rdf_parallel(sample_rdf_file, processes=2))
+
+    assert_reactions_match(reactions, expected_reactions)
+    assert [reaction.smiles for reaction in reactions] == [reaction.smiles for reaction in expected_reactions]
+    assert_rd_mol_properties_match(reactions, expected_reactions)
+
+
+def test_rdf_parser_from_path(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that a memory mapped file is parsed the same as an open file."""
+    with RDFParser.from_path(sample_rdf_file) as rdf_parser:
+        reactions = [reaction for reaction in rdf_parser]
+
+    assert_reactions_match(reactions, expected_reactions)
+
+
+def test_rdf_parser_from_path_empty_file(tmp_path: Path):
+    rdf_path = tmp_path / "empty.rdf"
+    rdf_path.touch()
+    assert list(RDFParser.from_path(rdf_path)) == []
+
+
+def test_rdf_parser_close(sample_rdf_file: str):
+    """Test that closing a parser created with from_path releases the memory
+    map."""
+    with RDFParser.from_path(sample_rdf_file) as rdf_parser:
+        next(rdf_parser)
+    assert rdf_parser.f.closed
+
+
+def test_rdf_parser_iter_blocks(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that iter_blocks yields the records reactions are created from."""
+    with open(sample_rdf_file, "r") as f:
+        records = list(RDFParser(f).iter_blocks())
+
+    assert records == [(reaction.rxn_block, reaction.id, reaction.lineno) for reaction in expected_reactions]
+
+
+def test_rdf_parser_parse_parallel(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that RDFParser.parse_parallel gives the same reactions as
+    iterating over the parser."""
+    with open(sample_rdf_file, "rb") as f:
+        reactions = list(RDFParser(f).parse_parallel(processes=2, chunksize=8))
+
+    assert_reactions_match(reactions, expected_reactions)
+    assert [reaction.smiles for reaction in reactions] == [reaction.smiles for reaction in expected_reactions]
+    assert_rd_mol_properties_match(reactions, expected_reactions)
+
+
+def test_rdf_parser_parse_parallel_raw(sample_rdf_file: str, expected_reactions: list[Reaction]):
+    """Test that RDFParser.parse_parallel yields records in raw mode."""
+    with open(sample_rdf_file, "rb") as f:
+        records = list(RDFParser(f, mode="raw").parse_parallel(processes=2))
+
+    assert records == [(reaction.rxn_block, reaction.id) for reaction in expected_reactions]
+
+
 @pytest.fixture
 def reaction_raise_exception(mocker: MockerFixture) -> MagicMock:
     mocker.patch.object(Reaction, "__init__", side_effect=InvalidReactionError("Test exception"))
@@ -1,9 +1,13 @@
+import pickle
+
 # Typing
 from unittest.mock import MagicMock
 
 import pytest
+from rdkit.Chem.rdChemReactions import ReactionFromSmarts, ReactionToRxnBlock
 
 from rdfreader.chem.reaction import Reaction
+from rdfreader.exceptions import InvalidMoleculeError
 
 
 def test_reaction_from_rxn_block(sample_rxn_block, sample_rxn_block_metadata):
@@ -26,6 +30,14 @@ def test_reaction_from_rxn_block_empty_raises():
         Reaction("")
 
 
+def test_reaction_unsanitizable_component_raises():
+    """Test a reactant RDKit can read but not sanitize (pentavalent carbon)
+    raises rather than being left out of the reaction."""
+    rxn_block = ReactionToRxnBlock(ReactionFromSmarts("C(C)(C)(C)(C)C>>CC", useSmiles=True))
+    with pytest.raises(InvalidMoleculeError):
+        Reaction(rxn_block)
+
+
 def test_reaction_to_smiles(mocker, sample_rxn_block):
     """Test that the reaction_to_smiles function gets called."""
     reaction_smiles_patch: MagicMock = mocker.patch("rdfreader.chem.reaction.reaction_smiles", return_value="CC>>CC")
@@ -33,9 +45,10 @@ def test_reaction_to_smiles(mocker, sample_rxn_block):
     # Reaction.from_rxn_block() passes
     reaction: Reaction = Reaction(sample_rxn_block)
     reaction.smiles
-    reaction_smiles_patch.assert_called()
-    # not _once because the reaction_to_smiles function is also called when
-    # the Reaction object is instantiated
+    reaction.smiles
+    # the smiles string is cached, and not needed for validation when
+    # invalid molecules raise
+    reaction_smiles_patch.assert_called_once()
 
 
 def test_reaction_to_smiles_no_reagents(mocker, sample_rxn_block):
@@ -45,4 +58,68 @@ def test_reaction_to_smiles_no_reagents(mocker, sample_rxn_block):
     # Reaction.from_rxn_block() passes
     reaction: Reaction = Reaction(sample_rxn_block)
     reaction.smiles_no_reagents
-    reaction_smiles_patch.assert_called()
+    reaction.smiles_no_reagents
+    # the smiles string is cached
+    reaction_smiles_patch.assert_called_once()
+
+
+def test_reaction_rd_rxn_is_cached(sample_rxn_block):
+    reaction = Reaction(sample_rxn_block)
+    assert reaction.rd_rxn is reaction.rd_rxn
+
+
+def test_reaction_rd_rxn_shared_cache(mocker, sample_rxn_block):
+    """Test that, with the cache enabled, identical reactions are only parsed
+    by RDKit once, and that each reaction gets its own RDKit reaction
+    object."""
+    reaction_from_smarts_spy: MagicMock = mocker.patch(
+        "rdfreader.chem.reaction.ReactionFromSmarts", wraps=ReactionFromSmarts
+    )
+    Reaction.set_rd_rxn_cache_size(16)
+    try:
+        first_reaction = Reaction(sample_rxn_block)
+        second_reaction = Reaction(sample_rxn_block)
+        assert first_reaction.rd_rxn is not second_reaction.rd_rxn
+        reaction_from_smarts_spy.assert_called_once()
+
+        Reaction.clear_cache()
+        Reaction(sample_rxn_block).rd_rxn
+        assert reaction_from_smarts_spy.call_count == 2
+    finally:
+        Reaction.set_rd_rxn_cache_size(0)
+
+
+def test_reaction_rd_rxn_cache_disabled_by_default(mocker, sample_rxn_block):
+    reaction_from_smarts_spy: MagicMock = mocker.patch(
+        "rdfreader.chem.reaction.ReactionFromSmarts", wraps=ReactionFromSmarts
+    )
+    Reaction(sample_rxn_block).rd_rxn
+    Reaction(sample_rxn_block).rd_rxn
+    assert reaction_from_smarts_spy.call_count == 2
+
+
+def test_reaction_has_no_instance_dict(sample_rxn_block):
+    """Reactions use __slots__, check they don't also get a __dict__."""
+    reaction = Reaction(sample_rxn_block)
+    assert not hasattr(reaction, "__dict__")
+    with pytest.raises(AttributeError):
+        reaction.not_an_attribute = None
+
+
+def test_reaction_pickle(sample_rxn_block):
+    reaction = Reaction(sample_rxn_block)
+    unpickled_reaction = pickle.loads(pickle.dumps(reaction))
+    assert unpickled_reaction.smiles == reaction.smiles
+    assert unpickled_reaction.metadata == reaction.metadata
+
+
+def test_reactions_from_rxn_blocks_parallel(sample_rxn_block):
+    rxn_blocks = [sample_rxn_block] * 3
+    reactions = list(Reaction.from_rxn_blocks_parallel(rxn_blocks, processes=2))
+
+    assert len(reactions) == len(rxn_blocks)
+    for reaction in reactions:
+        assert reaction.rxn_block == sample_rxn_block
+        assert reaction.smiles == Reaction(sample_rxn_block).smiles
+        # mol file properties of the RDKit molecules are kept
+        assert reaction.reactants[0].rd_mol.HasProp("_MolFileInfo")
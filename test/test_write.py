@@ -18,3 +18,17 @@ def test_write_rdf(first_sample_rxn):
 
         # first line should start with $RDFILE
         assert rdf_text.startswith("$RDFILE")
+
+
+def test_write_rdf_generator(first_sample_rxn):
+    """Test reaction blocks can be written from a generator, with generated
+    reaction ids."""
+    with NamedTemporaryFile("w+", suffix="rdf") as f:
+        write_rdf(f, (first_sample_rxn for _ in range(3)))
+
+        f.seek(0)
+
+        rdf_text = f.read()
+
+        assert rdf_text.count("$RXN") == 3
+        assert "$RFMT $RIREG 00003\n" in rdf_text